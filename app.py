@@ -4,34 +4,90 @@ Indian Language Translator for Render Deployment
 Make sure this file is in the ROOT directory
 """
 
+import hashlib
+import logging
 import os
+import re
 import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 # Add current directory to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from flask import Flask, render_template, request, jsonify, send_file
-    from deep_translator import GoogleTranslator
-    from gtts import gTTS
-    import tempfile
-    import logging
-    print("✅ All imports successful")
-except ImportError as e:
-    print(f"❌ Import Error: {e}")
-    print("Please install dependencies: pip install Flask deep-translator gtts langdetect")
-    sys.exit(1)
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+import deep_translator.google
+import orjson
+import requests
+from deep_translator import GoogleTranslator
+from flask import Flask, Response, render_template, request, send_file
+from gtts import gTTS
+from gtts.lang import tts_langs
+from jinja2 import FileSystemBytecodeCache
+from requests.adapters import HTTPAdapter
+
+# Configure logging; debug output from the request handlers is off unless LOG_LEVEL=DEBUG.
+# Unknown level names fall back to WARNING rather than failing at import.
+LOG_LEVEL = os.environ.get('LOG_LEVEL', 'WARNING').upper()
+if not isinstance(logging.getLevelName(LOG_LEVEL), int):
+    LOG_LEVEL = 'WARNING'
+logging.basicConfig(level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
 
+# One pooled keep-alive session for all translation requests, so repeat calls
+# to Google skip the TCP/TLS handshake. deep-translator calls the module-level
+# requests.get(), which this redirects to the session.
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=20, pool_maxsize=20, max_retries=3))
+deep_translator.google.requests = _SESSION
+
 # Get PORT from environment or use default
 PORT = int(os.environ.get('PORT', 5000))
 
+# Longer /translate input is truncated; /translate_long accepts more, split into sentences
+MAX_TRANSLATE_LENGTH = 4500
+MAX_LONG_TEXT_LENGTH = 50000
+MAX_BATCH_SIZE = 100
+# /translate input longer than this is split into sentences translated in parallel
+SENTENCE_SPLIT_LENGTH = 500
+_SENTENCE_END = re.compile(r'(?<=[.!?।॥۔])(\s+)')
+_WHITESPACE = re.compile(r'\s+')
+
+# Generated speech is cached on disk, keyed by a hash of its inputs
+TTS_CACHE_DIR = os.path.join(tempfile.gettempdir(), 'tts_cache')
+TTS_CACHE_MAX_FILES = int(os.environ.get('TTS_CACHE_MAX_FILES', 500))
+os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+_CACHE_KEY = re.compile(r'[0-9a-f]{64}')
+# Not every supported translation language has a gTTS voice (e.g. Odia, Assamese)
+_GTTS_LANGS = frozenset(tts_langs())
+
+# Cached audio filenames known to exist, least recently used first
+_AUDIO_FILES = OrderedDict()
+_AUDIO_FILES_LOCK = threading.Lock()
+AUDIO_FILES_MAX = 10000
+AUDIO_MAX_AGE = 31536000  # one year
+
+# Speech is generated in the background; jobs are keyed by their cache key.
+# <key>.job and <key>.err marker files in TTS_CACHE_DIR let every worker
+# process report a job's state, whichever worker ran it.
+_TTS_EXECUTOR = ThreadPoolExecutor(max_workers=8)
+TTS_JOB_TIMEOUT = 120  # seconds before an unfinished job is treated as lost
+TTS_MARKER_MAX_AGE = 3600
+_TTS_JOBS = {}
+_TTS_JOBS_LOCK = threading.Lock()
+
 app = Flask(__name__)
 app.secret_key = os.environ.get('SECRET_KEY', 'render-translator-secret-2024')
 
+# Compiled templates are cached on disk and never re-checked for changes. With no
+# directory given, Jinja uses a per-user 0700 temp directory and verifies its owner.
+app.config['TEMPLATES_AUTO_RELOAD'] = False
+app.jinja_env.auto_reload = False
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+
 # Indian Languages with TTS support
 INDIAN_LANGUAGES = {
     'hi': {'name': 'Hindi', 'native': 'हिन्दी', 'tts_lang': 'hi'},
@@ -49,150 +105,530 @@ INDIAN_LANGUAGES = {
     'en': {'name': 'English', 'native': 'English', 'tts_lang': 'en'}
 }
 
+# Unicode blocks for target languages whose script no other supported language uses.
+# Hindi/Marathi (Devanagari), Bengali/Assamese and Urdu (Arabic) share scripts, and
+# English shares Latin with many languages, so text in those scripts still needs the API.
+_SCRIPT_RANGES = {
+    'pa': (0x0A00, 0x0A7F),  # Gurmukhi
+    'gu': (0x0A80, 0x0AFF),  # Gujarati
+    'or': (0x0B00, 0x0B7F),  # Odia
+    'ta': (0x0B80, 0x0BFF),  # Tamil
+    'te': (0x0C00, 0x0C7F),  # Telugu
+    'kn': (0x0C80, 0x0CFF),  # Kannada
+    'ml': (0x0D00, 0x0D7F),  # Malayalam
+}
+
+def _is_in_target_script(text, target_lang):
+    """Check whether every letter in text is already in the target language's script"""
+    script_range = _SCRIPT_RANGES.get(target_lang)
+    if script_range is None:
+        return False
+    low, high = script_range
+    letters = [c for c in text if c.isalpha()]
+    return bool(letters) and all(low <= ord(c) <= high for c in letters)
+
+# /languages and /health never change while the process runs, so encode them once
+_LANGUAGES_RESPONSE_BODY = orjson.dumps({
+    'success': True,
+    'languages': INDIAN_LANGUAGES,
+    'count': len(INDIAN_LANGUAGES)
+})
+
+_HEALTH_RESPONSE_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'Indian Language Translator',
+    'port': PORT,
+    'languages': len(INDIAN_LANGUAGES)
+})
+
+def ojsonify(obj, status=200):
+    """JSON response serialized with orjson instead of Flask's jsonify"""
+    return Response(orjson.dumps(obj), status=status, mimetype='application/json')
+
+# GoogleTranslator.translate() stores the text on the instance, so instances
+# can't be shared between threads. Translation runs on _TRANSLATE_EXECUTOR,
+# whose long-lived threads each build their own set once at startup.
+_worker_state = threading.local()
+
+def _init_translate_worker():
+    """Build this executor thread's translators up front"""
+    _worker_state.translators = {code: GoogleTranslator(source='auto', target=code) for code in INDIAN_LANGUAGES}
+
+_TRANSLATE_EXECUTOR = ThreadPoolExecutor(max_workers=8, initializer=_init_translate_worker)
+
+def _get_translator(target_lang, rebuild=False):
+    """Get the current thread's translator for a target language"""
+    translators = getattr(_worker_state, 'translators', None)
+    if translators is None:
+        translators = _worker_state.translators = {}
+    translator = translators.get(target_lang)
+    if translator is None or rebuild:
+        translator = GoogleTranslator(source='auto', target=target_lang)
+        translators[target_lang] = translator
+    return translator
+
+def _translate_uncached(text, target_lang):
+    """Translate text with the current thread's translator"""
+    try:
+        return _get_translator(target_lang).translate(text)
+    except Exception as e:
+        # Retry once with a fresh translator in case this one went stale
+        logger.warning(f"Translation failed, rebuilding translator for {target_lang}: {e}")
+        return _get_translator(target_lang, rebuild=True).translate(text)
+
+# Bounded in memory as well as entries: only texts up to SENTENCE_SPLIT_LENGTH
+# are cached, which still covers every sentence of a long /translate input
+@lru_cache(maxsize=4096)
+def _translate_short(text, target_lang):
+    """Cached translation of a short text"""
+    return _translate_uncached(text, target_lang)
+
+def _cached_translate(text, target_lang):
+    """Translate text, skipping the API call for repeated short (text, target_lang) pairs"""
+    if len(text) > SENTENCE_SPLIT_LENGTH:
+        return _translate_uncached(text, target_lang)
+    return _translate_short(text, target_lang)
+
+def _split_at_whitespace(sentence):
+    """Break a sentence too long for one API call into chunks, alternating with the whitespace between them"""
+    parts = []
+    while len(sentence) > MAX_TRANSLATE_LENGTH:
+        match = None
+        for match in _WHITESPACE.finditer(sentence, 0, MAX_TRANSLATE_LENGTH + 1):
+            pass
+        if match is None:
+            # No whitespace to break at, so cut mid-word
+            parts += [sentence[:MAX_TRANSLATE_LENGTH], '']
+            sentence = sentence[MAX_TRANSLATE_LENGTH:]
+        else:
+            parts += [sentence[:match.start()], match.group()]
+            sentence = sentence[match.end():]
+    parts.append(sentence)
+    return parts
+
+def _translate_sentences(text, target_lang):
+    """Translate text sentence by sentence, in parallel and through the cache"""
+    # The capturing group makes split() alternate sentences and the whitespace
+    # between them, so newlines and paragraph breaks are put back unchanged
+    parts = []
+    for index, part in enumerate(_SENTENCE_END.split(text)):
+        parts.extend(_split_at_whitespace(part) if index % 2 == 0 else [part])
+    sentences = parts[0::2]
+    futures = {sentence: _TRANSLATE_EXECUTOR.submit(_cached_translate, sentence, target_lang)
+               for sentence in dict.fromkeys(sentences) if sentence}
+    parts[0::2] = [(futures[sentence].result() or '') if sentence else '' for sentence in sentences]
+    return ''.join(parts)
+
+def _tts_cache_key(text, tts_lang, slow=False):
+    """Content hash identifying the speech generated for these inputs"""
+    return hashlib.sha256(f"{tts_lang}|{int(slow)}|{text}".encode('utf-8')).hexdigest()
+
+def _remember_audio_file(filename):
+    """Record a cached audio file so /audio can skip the filesystem check"""
+    with _AUDIO_FILES_LOCK:
+        _AUDIO_FILES[filename] = time.time()
+        _AUDIO_FILES.move_to_end(filename)
+        if len(_AUDIO_FILES) > AUDIO_FILES_MAX:
+            _AUDIO_FILES.popitem(last=False)
+
+def _forget_audio_file(filename):
+    """Drop a cached audio file that no longer exists"""
+    with _AUDIO_FILES_LOCK:
+        _AUDIO_FILES.pop(filename, None)
+
+def _tts_marker_path(key, kind):
+    """Path of a job ('job') or failure ('err') marker for a cache key"""
+    return os.path.join(TTS_CACHE_DIR, f'{key}.{kind}')
+
+def _remove_file(path):
+    """Delete a file if it exists"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _stat_or_none(entry):
+    """Stat a cache entry, or None if another worker already removed it"""
+    try:
+        return entry.stat()
+    except FileNotFoundError:
+        return None
+
+def _evict_tts_cache():
+    """Delete the least recently used MP3s once the cache grows past its limit"""
+    try:
+        # Every worker process sweeps the same directory, so files may vanish mid-sweep
+        entries = [(entry, _stat_or_none(entry)) for entry in os.scandir(TTS_CACHE_DIR)]
+        entries = [(entry, stat) for entry, stat in entries if stat is not None and entry.is_file()]
+        
+        # Old markers belong to jobs that are long finished or lost
+        now = time.time()
+        for entry, stat in entries:
+            if entry.name.endswith(('.job', '.err')) and now - stat.st_mtime > TTS_MARKER_MAX_AGE:
+                _remove_file(entry.path)
+        
+        entries = [(entry, stat) for entry, stat in entries if entry.name.endswith('.mp3')]
+        if len(entries) <= TTS_CACHE_MAX_FILES:
+            return
+        entries.sort(key=lambda item: item[1].st_atime, reverse=True)
+        for entry, _ in entries[TTS_CACHE_MAX_FILES:]:
+            _forget_audio_file(entry.name)
+            _remove_file(entry.path)
+    except OSError as e:
+        logger.warning(f"TTS cache eviction failed: {e}")
+
+def _generate_mp3(key, text, tts_lang):
+    """Generate speech with gTTS and move it into the cache"""
+    cache_path = os.path.join(TTS_CACHE_DIR, f'{key}.mp3')
+    # Write to a private temp name and rename, so readers never see a partial file
+    tmp_path = f'{cache_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    try:
+        tts = gTTS(text=text, lang=tts_lang, slow=False)
+        tts.save(tmp_path)
+        os.replace(tmp_path, cache_path)
+    except Exception as e:
+        # gTTS opens the file before downloading, so a failed request leaves a partial file
+        _remove_file(tmp_path)
+        logger.error(f"TTS error: {e}")
+        # Record the failure before dropping the job marker, so status polls never see neither
+        err_path = _tts_marker_path(key, 'err')
+        with open(f'{err_path}.{os.getpid()}.{threading.get_ident()}.tmp', 'w', encoding='utf-8') as f:
+            f.write(str(e))
+        os.replace(f.name, err_path)
+        _remove_file(_tts_marker_path(key, 'job'))
+        raise
+    _remove_file(_tts_marker_path(key, 'job'))
+    _remember_audio_file(os.path.basename(cache_path))
+    _evict_tts_cache()
+    logger.debug("Speech generated: %s", cache_path)
+
+def _submit_tts_job(key, text, tts_lang):
+    """Start generating speech unless a job for the same key is already running"""
+    with _TTS_JOBS_LOCK:
+        future = _TTS_JOBS.get(key)
+        # A finished job without a cached file either failed or was evicted
+        if future is None or future.done():
+            for job_id in [job_id for job_id, job in _TTS_JOBS.items() if job.done()]:
+                del _TTS_JOBS[job_id]
+            # Mark the job as running before clearing any earlier failure
+            open(_tts_marker_path(key, 'job'), 'w').close()
+            _remove_file(_tts_marker_path(key, 'err'))
+            _TTS_JOBS[key] = _TTS_EXECUTOR.submit(_generate_mp3, key, text, tts_lang)
+
+# Served when templates/index.html is missing; encoded once at startup
+_FALLBACK_HTML = """
+<html>
+<head><title>Indian Translator</title></head>
+<body>
+    <h1>Indian Language Translator</h1>
+    <p>Template not found. Please ensure templates/index.html exists.</p>
+</body>
+</html>
+""".encode('utf-8')
+
+_TEMPLATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates', 'index.html')
+_TEMPLATE_EXISTS = os.path.exists(_TEMPLATE_PATH)
+
+# Compile the page template now so the first request doesn't pay for it
+if _TEMPLATE_EXISTS:
+    try:
+        app.jinja_env.get_template('index.html')
+    except Exception as e:
+        logger.error("Template error: %s", e)
+
 @app.route('/')
 def home():
     """Home page with translation interface"""
-    print("📄 Serving home page")
-    try:
-        return render_template('index.html', languages=INDIAN_LANGUAGES)
-    except Exception as e:
-        print(f"❌ Template error: {e}")
-        return """
-        <html>
-        <head><title>Indian Translator</title></head>
-        <body>
-            <h1>Indian Language Translator</h1>
-            <p>Template not found. Please ensure templates/index.html exists.</p>
-        </body>
-        </html>
-        """
+    if _TEMPLATE_EXISTS:
+        try:
+            return render_template('index.html', languages=INDIAN_LANGUAGES)
+        except Exception as e:
+            logger.error("Template error: %s", e)
+    return Response(_FALLBACK_HTML, content_type='text/html; charset=utf-8')
 
 @app.route('/health')
 def health():
     """Health check endpoint for Render"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'Indian Language Translator',
-        'port': PORT,
-        'languages': len(INDIAN_LANGUAGES)
-    })
+    return Response(_HEALTH_RESPONSE_BODY, mimetype='application/json')
 
 @app.route('/translate', methods=['POST'])
 def translate():
     """Translate text between languages"""
     try:
-        print("🔄 Translation request received")
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return ojsonify({'error': 'No data provided'}, status=400)
             
         text = data.get('text', '').strip()
         target_lang = data.get('target_lang', 'hi')
         
         if not text:
-            return jsonify({'error': 'Please enter text'}), 400
+            return ojsonify({'error': 'Please enter text'}, status=400)
         
-        print(f"📝 Translating: '{text[:50]}...' to {target_lang}")
+        # Bound request time; Google Translate rejects input over 5000 characters anyway
+        truncated = len(text) > MAX_TRANSLATE_LENGTH
+        text = text[:MAX_TRANSLATE_LENGTH]
         
-        # Translate using Google Translator
-        translator = GoogleTranslator(source='auto', target=target_lang)
-        translated = translator.translate(text)
+        logger.debug("Translating %d chars to %s", len(text), target_lang)
         
-        print(f"✅ Translation successful")
+        if _is_in_target_script(text, target_lang):
+            # Already in the target language, no API call needed
+            translated = text
+        elif len(text) > SENTENCE_SPLIT_LENGTH:
+            # Sentences are translated concurrently and cached individually,
+            # so editing one sentence only re-translates that sentence
+            translated = _translate_sentences(text, target_lang)
+        else:
+            # Translate using Google Translator (cached), on an executor thread so
+            # the translators it built at startup are reused
+            translated = _TRANSLATE_EXECUTOR.submit(_cached_translate, text, target_lang).result()
         
-        return jsonify({
+        return ojsonify({
             'success': True,
             'original_text': text,
             'translated_text': translated,
-            'target_lang': INDIAN_LANGUAGES.get(target_lang, {}).get('name', 'Unknown')
+            'target_lang': INDIAN_LANGUAGES.get(target_lang, {}).get('name', 'Unknown'),
+            'truncated': truncated
         })
         
     except Exception as e:
         logger.error(f"Translation error: {e}")
-        return jsonify({'error': f'Translation failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Translation failed: {str(e)}'}, status=500)
+
+@app.route('/translate_long', methods=['POST'])
+def translate_long():
+    """Translate long text by splitting it into sentences"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return ojsonify({'error': 'No data provided'}, status=400)
+            
+        text = data.get('text', '').strip()
+        target_lang = data.get('target_lang', 'hi')
+        
+        if not text:
+            return ojsonify({'error': 'Please enter text'}, status=400)
+        
+        truncated = len(text) > MAX_LONG_TEXT_LENGTH
+        text = text[:MAX_LONG_TEXT_LENGTH]
+        
+        logger.debug("Translating %d chars to %s by sentence", len(text), target_lang)
+        
+        translated = _translate_sentences(text, target_lang)
+        
+        return ojsonify({
+            'success': True,
+            'original_text': text,
+            'translated_text': translated,
+            'target_lang': INDIAN_LANGUAGES.get(target_lang, {}).get('name', 'Unknown'),
+            'truncated': truncated
+        })
+        
+    except Exception as e:
+        logger.error(f"Long translation error: {e}")
+        return ojsonify({'error': f'Translation failed: {str(e)}'}, status=500)
+
+@app.route('/translate_batch', methods=['POST'])
+def translate_batch():
+    """Translate a list of texts, calling the API once per unique text"""
+    try:
+        data = request.get_json()
+        
+        if not data:
+            return ojsonify({'error': 'No data provided'}, status=400)
+            
+        texts = data.get('texts')
+        target_lang = data.get('target_lang', 'hi')
+        
+        if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+            return ojsonify({'error': 'texts must be a list of strings'}, status=400)
+        
+        if len(texts) > MAX_BATCH_SIZE:
+            return ojsonify({'error': f'At most {MAX_BATCH_SIZE} texts per batch'}, status=400)
+        
+        texts = [t.strip() for t in texts]
+        truncated = any(len(t) > MAX_TRANSLATE_LENGTH for t in texts)
+        texts = [t[:MAX_TRANSLATE_LENGTH] for t in texts]
+        
+        # Deduplicate while keeping order; each unique text is translated in
+        # parallel through the cache
+        futures = {t: _TRANSLATE_EXECUTOR.submit(_cached_translate, t, target_lang)
+                   for t in dict.fromkeys(texts) if t}
+        translations = {t: future.result() or '' for t, future in futures.items()}
+        
+        return ojsonify({
+            'success': True,
+            'translations': [translations.get(t, '') for t in texts],
+            'target_lang': INDIAN_LANGUAGES.get(target_lang, {}).get('name', 'Unknown'),
+            'truncated': truncated
+        })
+        
+    except Exception as e:
+        logger.error(f"Batch translation error: {e}")
+        return ojsonify({'error': f'Translation failed: {str(e)}'}, status=500)
 
 @app.route('/tts', methods=['POST'])
 def text_to_speech():
     """Convert text to speech"""
     try:
-        print("🔊 TTS request received")
         data = request.get_json()
         
         if not data:
-            return jsonify({'error': 'No data provided'}), 400
+            return ojsonify({'error': 'No data provided'}, status=400)
             
         text = data.get('text', '').strip()
         lang = data.get('lang', 'en')
         
         if not text:
-            return jsonify({'error': 'No text provided'}), 400
+            return ojsonify({'error': 'No text provided'}, status=400)
         
         # Limit text length for performance
         text = text[:500]
         
-        print(f"🎵 Generating speech for {lang}, text length: {len(text)}")
+        logger.debug("Generating speech for %s, text length: %d", lang, len(text))
         
         # Get TTS language code
         lang_info = INDIAN_LANGUAGES.get(lang, INDIAN_LANGUAGES['en'])
         tts_lang = lang_info['tts_lang']
         
-        # Create temporary file
-        temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp3')
-        temp_path = temp_file.name
+        if tts_lang not in _GTTS_LANGS:
+            return ojsonify({'error': f"Speech is not available for {lang_info['name']}"}, status=400)
         
-        # Generate speech
-        tts = gTTS(text=text, lang=tts_lang, slow=False)
-        tts.save(temp_path)
-        
-        print(f"✅ Speech generated: {temp_path}")
+        # Reuse cached speech, generating it only on a miss
+        key = _tts_cache_key(text, tts_lang)
+        filename = f'{key}.mp3'
+        cache_path = os.path.join(TTS_CACHE_DIR, filename)
         
-        filename = os.path.basename(temp_path)
+        if os.path.exists(cache_path):
+            try:
+                # Record use in atime for eviction; mtime stays fixed so the ETag and
+                # Last-Modified of the immutable /audio URL never change
+                os.utime(cache_path, (time.time(), os.stat(cache_path).st_mtime))
+            except FileNotFoundError:
+                # Evicted since the check; generate it again below
+                pass
+            else:
+                _remember_audio_file(filename)
+                logger.debug("Speech cache hit: %s", cache_path)
+                
+                return ojsonify({
+                    'success': True,
+                    'status': 'ready',
+                    'audio_url': f'/audio/{filename}',
+                    'message': 'Speech generated successfully'
+                })
         
-        return jsonify({
+        # Generate in the background; the client polls /tts_status
+        _submit_tts_job(key, text, tts_lang)
+        return ojsonify({
             'success': True,
+            'status': 'pending',
+            'job_id': key,
+            'status_url': f'/tts_status/{key}',
             'audio_url': f'/audio/{filename}',
-            'message': 'Speech generated successfully'
-        })
+            'message': 'Speech generation started'
+        }, status=202)
         
     except Exception as e:
         logger.error(f"TTS error: {e}")
-        return jsonify({'error': f'Speech generation failed: {str(e)}'}), 500
+        return ojsonify({'error': f'Speech generation failed: {str(e)}'}, status=500)
+
+@app.route('/tts_status/<job_id>')
+def tts_status(job_id):
+    """Report whether background speech generation has finished"""
+    # Job IDs are SHA-256 hex digests
+    if not _CACHE_KEY.fullmatch(job_id):
+        return ojsonify({'error': 'Unknown job'}, status=404)
+    
+    filename = f'{job_id}.mp3'
+    
+    # Jobs may run in another worker process, so the cache and marker files are
+    # the source of truth
+    if filename in _AUDIO_FILES or os.path.exists(os.path.join(TTS_CACHE_DIR, filename)):
+        return ojsonify({
+            'success': True,
+            'status': 'ready',
+            'audio_url': f'/audio/{filename}',
+            'message': 'Speech generated successfully'
+        })
+    
+    try:
+        if time.time() - os.path.getmtime(_tts_marker_path(job_id, 'job')) <= TTS_JOB_TIMEOUT:
+            return ojsonify({
+                'success': True,
+                'status': 'pending',
+                'job_id': job_id,
+                'status_url': f'/tts_status/{job_id}'
+            })
+    except FileNotFoundError:
+        pass
+    
+    try:
+        with open(_tts_marker_path(job_id, 'err'), encoding='utf-8') as f:
+            error = f.read()
+        return ojsonify({
+            'success': False,
+            'status': 'error',
+            'error': f'Speech generation failed: {error}'
+        }, status=500)
+    except FileNotFoundError:
+        pass
+    
+    # Never submitted, lost to a restart, or timed out
+    return ojsonify({'error': 'Unknown job'}, status=404)
 
 @app.route('/audio/<filename>')
 def serve_audio(filename):
     """Serve generated audio files"""
     try:
-        print(f"🎧 Serving audio file: {filename}")
-        temp_dir = tempfile.gettempdir()
-        file_path = os.path.join(temp_dir, filename)
-        
-        if os.path.exists(file_path):
-            return send_file(
-                file_path,
-                mimetype='audio/mpeg',
-                as_attachment=False,
-                download_name="translation.mp3"
-            )
-        else:
-            print(f"❌ Audio file not found: {file_path}")
-            return jsonify({'error': 'Audio file not found'}), 404
+        logger.debug("Serving audio file: %s", filename)
+        
+        # Only cache files, named <sha256>.mp3, are served
+        key, extension = os.path.splitext(filename)
+        if extension != '.mp3' or not _CACHE_KEY.fullmatch(key):
+            return ojsonify({'error': 'Audio file not found'}, status=404)
+        
+        file_path = os.path.join(TTS_CACHE_DIR, filename)
+        
+        # Files generated by this process are served without a filesystem check;
+        # others (after a restart or from another worker) are looked up on disk
+        if filename not in _AUDIO_FILES:
+            if not os.path.exists(file_path):
+                logger.debug("Audio file not found: %s", file_path)
+                return ojsonify({'error': 'Audio file not found'}, status=404)
+            _remember_audio_file(filename)
+        
+        # Audio filenames are content hashes, so a URL's content never changes
+        response = send_file(
+            file_path,
+            mimetype='audio/mpeg',
+            as_attachment=False,
+            download_name="translation.mp3",
+            conditional=True,
+            etag=key,
+            max_age=AUDIO_MAX_AGE
+        )
+        response.headers['Cache-Control'] = f'public, max-age={AUDIO_MAX_AGE}, immutable'
+        return response
             
+    except FileNotFoundError:
+        # Evicted from the cache after it was recorded
+        _forget_audio_file(filename)
+        return ojsonify({'error': 'Audio file not found'}, status=404)
     except Exception as e:
         logger.error(f"Audio serve error: {e}")
-        return jsonify({'error': str(e)}), 500
+        return ojsonify({'error': str(e)}, status=500)
 
 @app.route('/languages', methods=['GET'])
 def get_languages():
     """Get list of supported languages"""
-    return jsonify({
-        'success': True,
-        'languages': INDIAN_LANGUAGES,
-        'count': len(INDIAN_LANGUAGES)
-    })
+    return Response(_LANGUAGES_RESPONSE_BODY, mimetype='application/json')
 
 def create_template_if_missing():
     """Create basic template if it doesn't exist"""
+    global _TEMPLATE_EXISTS
     template_dir = os.path.join(os.path.dirname(__file__), 'templates')
     os.makedirs(template_dir, exist_ok=True)
     
@@ -253,8 +689,13 @@ def create_template_if_missing():
                 body: JSON.stringify({text: text, lang: lang})
             });
             
-            const data = await res.json();
-            if (data.success) {
+            let data = await res.json();
+            // Poll until background speech generation finishes
+            for (let attempt = 0; data.status === 'pending' && attempt < 60; attempt++) {
+                await new Promise(resolve => setTimeout(resolve, 500));
+                data = await (await fetch(data.status_url)).json();
+            }
+            if (data.success && data.status === 'ready') {
                 document.getElementById('audio').src = data.audio_url;
                 document.getElementById('audio').play();
             }
@@ -267,6 +708,8 @@ def create_template_if_missing():
             f.write(basic_html)
         
         print(f"✅ Template created at: {template_path}")
+    
+    _TEMPLATE_EXISTS = True
 
 if __name__ == '__main__':
     print("=" * 60)
@@ -281,20 +724,14 @@ if __name__ == '__main__':
     # Create template if missing
     create_template_if_missing()
     
-    # List files in current directory
-    print("📁 Files in current directory:")
-    for root, dirs, files in os.walk('.'):
-        level = root.replace('.', '').count(os.sep)
-        indent = ' ' * 2 * level
-        print(f"{indent}{os.path.basename(root)}/")
-        subindent = ' ' * 2 * (level + 1)
-        for file in files:
-            print(f"{subindent}{file}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Files in %s: %s", os.getcwd(), os.listdir('.'))
     
     print("=" * 60)
-    print("🚀 Starting Flask server...")
+    print("🚀 Starting Flask development server...")
+    print("   (production: gunicorn -c gunicorn.conf.py app:app)")
     
-    # Run the app
+    # Local development only; production runs under gunicorn (see gunicorn.conf.py)
     app.run(
         host='0.0.0.0',
         port=PORT,
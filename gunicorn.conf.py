@@ -0,0 +1,15 @@
+"""
+Gunicorn configuration for Render deployment
+Start with: gunicorn -c gunicorn.conf.py app:app
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# gevent workers monkey-patch sockets before app.py is imported, so the
+# network-bound translate/TTS calls yield instead of blocking the worker
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+worker_class = 'gevent'
+worker_connections = 200
+timeout = 60
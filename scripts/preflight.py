@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+Preflight checks for the Indian Language Translator
+Run before starting the app: python scripts/preflight.py
+"""
+
+import importlib
+import sys
+
+MIN_PYTHON = (3, 9)
+REQUIRED_MODULES = ['flask', 'deep_translator', 'gtts', 'jinja2', 'orjson', 'requests']
+
+def main():
+    """Check the Python version and that all dependencies import"""
+    ok = True
+    
+    if sys.version_info < MIN_PYTHON:
+        print(f"❌ Python {MIN_PYTHON[0]}.{MIN_PYTHON[1]}+ required, found {sys.version.split()[0]}")
+        ok = False
+    else:
+        print(f"✅ Python {sys.version.split()[0]}")
+    
+    for module in REQUIRED_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError as e:
+            print(f"❌ Import Error: {e}")
+            ok = False
+    
+    if not ok:
+        print("Please install dependencies: pip install -r requirements.txt")
+        return 1
+    
+    print("✅ All imports successful")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
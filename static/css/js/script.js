@@ -201,7 +201,7 @@ async function generateSpeech() {
             })
         });
 
-        const data = await response.json();
+        const data = await waitForAudio(await response.json());
 
         if (data.success) {
             currentAudioUrl = data.audio_url;
@@ -229,6 +229,19 @@ async function generateSpeech() {
     }
 }
 
+// Poll until background speech generation finishes
+async function waitForAudio(data) {
+    for (let attempt = 0; data.status === 'pending'; attempt++) {
+        if (attempt >= 60) {
+            return { success: false, error: 'Speech generation timed out' };
+        }
+        await new Promise(resolve => setTimeout(resolve, 500));
+        const response = await fetch(data.status_url);
+        data = await response.json();
+    }
+    return data;
+}
+
 // Copy translation
 function copyTranslation() {
     if (!currentTranslation) {